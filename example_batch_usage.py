@@ -158,9 +158,9 @@ async def example_large_scale_processing():
             output_format="json",
         )
 
-        # Analyze timing and success rates
-        successful = [r for r in results if r["success"]]
-        print(f"✅ Success rate: {len(successful)}/{len(demo_urls)} ({100 * len(successful) / len(demo_urls):.1f}%)")
+        # Analyze timing and success rates (counted by the scraper, no need to re-filter)
+        summary = scraper.last_summary
+        print(f"✅ Success rate: {summary['success']}/{summary['total']} ({100 * summary['success'] / summary['total']:.1f}%)")
 
         # Show domain-wise stats
         domains = {}
@@ -2,17 +2,12 @@
 """Main entry point for running regscraper as a module."""
 
 import argparse
-import asyncio
-import json
 import logging
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-# Import the main components
-from regscraper.downloader.factory import DownloaderFactory
-from regscraper.extractor.factory import ExtractorFactory
-
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -22,18 +17,26 @@ async def scrape_url(
     url: str, output_format: str = "text", output_file: str | None = None, delay: float = 2.0, user_agent: str = "RegScraper/2.0"
 ) -> None:
     """Scrape a URL and extract its content."""
+    # Heavy components (httpx, playwright, PyMuPDF, trafilatura) load only when a scrape runs,
+    # keeping `--help` and argument errors fast
+    from regscraper.downloader.factory import DownloaderFactory  # noqa: PLC0415
+    from regscraper.extractor.factory import ExtractorFactory  # noqa: PLC0415
+    from regscraper.serialization import dumps, to_jsonable  # noqa: PLC0415
+
+    # Create factories with SEC-specific throttling
+    site_overrides: dict[str, dict[str, Any]] = {"sec.gov": {"delay": delay, "concurrency": 1, "type": "static"}}
+    downloader_factory = DownloaderFactory(site_overrides=site_overrides, default_delay=delay, default_concurrency=1, user_agent=user_agent)
+
     try:
-        # Create factories with SEC-specific throttling
-        site_overrides: dict[str, dict[str, Any]] = {"sec.gov": {"delay": delay, "concurrency": 1, "type": "static"}}
-        downloader_factory = DownloaderFactory(
-            site_overrides=site_overrides, default_delay=delay, default_concurrency=1, user_agent=user_agent
-        )
         extractor_factory = ExtractorFactory()
 
         # Download content
         logger.info("📥 Downloading: %s", url)
         downloader = downloader_factory.create_downloader(url)
-        download_result = await downloader.download(url)
+        try:
+            download_result = await downloader.download(url)
+        finally:
+            await downloader_factory.aclose()
 
         logger.info("✅ Downloaded %d bytes (%s)", len(download_result.content), download_result.content_type)
 
@@ -47,17 +50,8 @@ async def scrape_url(
 
         # Prepare output
         if output_format == "json":
-            # Safely convert metadata to ensure JSON serialization
-            metadata_dict: dict[str, Any] = {}
-            try:
-                # Use getattr to safely access metadata and convert to dict
-                metadata = getattr(extraction_result, "metadata", {})
-                if metadata:
-                    # Use JSON serialization/deserialization to handle unknown types safely
-                    metadata_json = json.dumps(metadata, default=str)
-                    metadata_dict = json.loads(metadata_json)
-            except (TypeError, ValueError, json.JSONDecodeError, AttributeError):
-                metadata_dict = {"error": "metadata not available"}
+            # Normalize metadata to JSON-native types
+            metadata_dict: dict[str, Any] = to_jsonable(getattr(extraction_result, "metadata", {}) or {})
 
             output_data: dict[str, Any] = {
                 "url": url,
@@ -66,7 +60,7 @@ async def scrape_url(
                 "metadata": metadata_dict,
                 "length": len(extraction_result.text),
             }
-            output_content = json.dumps(output_data, indent=2, ensure_ascii=False)
+            output_content = dumps(output_data)
         else:
             output_content = extraction_result.text
 
@@ -84,6 +78,16 @@ async def scrape_url(
         sys.exit(1)
 
 
+def _event_loop_factory() -> Callable[[], Any] | None:
+    """Get uvloop's event loop factory when it is installed, otherwise None for asyncio's default loop."""
+    # Try to import uvloop - it's optional (and unavailable on Windows), and runs the event loop in C
+    try:
+        import uvloop  # type: ignore[import-not-found]  # noqa: PLC0415
+    except ImportError:
+        return None
+    return uvloop.new_event_loop  # type: ignore[no-any-return]
+
+
 def main() -> None:
     """Main entry point for command-line interface."""
     parser = argparse.ArgumentParser(
@@ -115,7 +119,12 @@ Examples:
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Run the scraper
-    asyncio.run(scrape_url(url=args.url, output_format=args.format, output_file=args.output, delay=args.delay, user_agent=args.user_agent))
+    import asyncio  # noqa: PLC0415
+
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        runner.run(
+            scrape_url(url=args.url, output_format=args.format, output_file=args.output, delay=args.delay, user_agent=args.user_agent)
+        )
 
 
 if __name__ == "__main__":
@@ -2,18 +2,66 @@
 """Batch processing module for scraping multiple URLs with shared throttling."""
 
 import asyncio
-import json
 import logging
+import multiprocessing
+import os
 import time
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from urllib.parse import urlparse
+from types import MappingProxyType
+from typing import IO, Any, Final
+
+import httpx
 
 from regscraper.downloader.factory import DownloaderFactory
 from regscraper.extractor.factory import ExtractorFactory
+from regscraper.infrastructure import get_domain, normalize_url
+from regscraper.interfaces import DownloadResult
+from regscraper.serialization import dumps_bytes, to_jsonable
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on result files being written at once (caps open FDs and worker threads)
+_MAX_CONCURRENT_WRITES = 32
+
+# Separator written before each record in the combined text output
+_TEXT_SEPARATOR = "\n\n" + "=" * 80 + "\n\n"
+
+# Default configurations for common domains, including conservative defaults
+# for unknown domains via the '*' wildcard key
+_DEFAULT_SITE_CONFIGS: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType(
+    {
+        # Conservative defaults for any domain not explicitly configured
+        "*": MappingProxyType({"delay": 3.0, "concurrency": 1, "type": "static"}),
+        # Known domain-specific configurations
+        "sec.gov": MappingProxyType({"delay": 2.0, "concurrency": 1, "type": "static"}),
+        "bis.org": MappingProxyType({"delay": 1.5, "concurrency": 2, "type": "static"}),
+        "federalregister.gov": MappingProxyType({"delay": 1.0, "concurrency": 2, "type": "static"}),
+        "treasury.gov": MappingProxyType({"delay": 2.0, "concurrency": 1, "type": "static"}),
+        "cftc.gov": MappingProxyType({"delay": 1.5, "concurrency": 2, "type": "static"}),
+        "occ.gov": MappingProxyType({"delay": 2.0, "concurrency": 1, "type": "static"}),
+    }
+)
+
+# Final fallback when no wildcard configuration is defined
+_FALLBACK_SITE_CONFIG: Final[Mapping[str, Any]] = MappingProxyType({"delay": 3.0, "concurrency": 1, "type": "static"})
+
+
+@lru_cache(maxsize=1)
+def _worker_extractor_factory() -> ExtractorFactory:
+    """Get the extractor factory of the current worker process."""
+    return ExtractorFactory()
+
+
+def _extract_in_worker(content: bytes, content_type: str, url: str) -> tuple[str, dict[str, Any]]:
+    """Extract text in a worker process, returning plain data to keep IPC cheap."""
+    extractor = _worker_extractor_factory().create_extractor(url, content_type)
+    extraction_result = asyncio.run(extractor.extract(DownloadResult(content, content_type, url)))
+    return extraction_result.text, to_jsonable(extraction_result.metadata)
+
 
 class BatchScraper:
     """Batch scraper with shared throttling across domains."""
@@ -24,38 +72,34 @@ class BatchScraper:
         default_delay: float = 2.0,
         default_concurrency: int = 2,
         user_agent: str = "RegScraper/2.0 (Batch)",
+        extraction_workers: int | None = None,
+        robots_cache_dir: str | Path | None = None,
     ) -> None:
-        """Initialize batch scraper with shared infrastructure."""
-        # Set up common domain configurations
-        if site_overrides is None:
-            site_overrides = self._get_default_site_configs()
+        """Initialize batch scraper with shared infrastructure.
 
-        self._site_overrides = site_overrides
+        Text extraction (PDF parsing, OCR, HTML cleanup) runs in a pool of extraction_workers
+        processes (default: one per CPU) so it never blocks downloads. The pool lives only for
+        the duration of each scrape_urls call. Every worker uses its own default
+        ExtractorFactory, so custom extractors cannot be registered for batch extraction.
+        With robots_cache_dir, fetched robots.txt files are saved there and reused by later runs.
+        """
+        # Set up common domain configurations (the shared defaults are read-only)
+        self._site_overrides: Mapping[str, Mapping[str, Any]] = _DEFAULT_SITE_CONFIGS if site_overrides is None else site_overrides
 
         # Create shared factories
         self._downloader_factory = DownloaderFactory(
-            site_overrides=site_overrides, default_delay=default_delay, default_concurrency=default_concurrency, user_agent=user_agent
+            site_overrides=self._site_overrides,
+            default_delay=default_delay,
+            default_concurrency=default_concurrency,
+            user_agent=user_agent,
+            robots_cache_dir=robots_cache_dir,
         )
-        self._extractor_factory = ExtractorFactory()
+        self._extraction_workers = extraction_workers
 
-    def _get_default_site_configs(self) -> dict[str, dict[str, Any]]:
-        """Get default configurations for common domains.
+        # Outcome counts of the most recent scrape_urls call
+        self.last_summary: dict[str, Any] = {}
 
-        Includes conservative defaults for unknown domains via the '*' wildcard key.
-        """
-        return {
-            # Conservative defaults for any domain not explicitly configured
-            "*": {"delay": 3.0, "concurrency": 1, "type": "static"},
-            # Known domain-specific configurations
-            "sec.gov": {"delay": 2.0, "concurrency": 1, "type": "static"},
-            "bis.org": {"delay": 1.5, "concurrency": 2, "type": "static"},
-            "federalregister.gov": {"delay": 1.0, "concurrency": 2, "type": "static"},
-            "treasury.gov": {"delay": 2.0, "concurrency": 1, "type": "static"},
-            "cftc.gov": {"delay": 1.5, "concurrency": 2, "type": "static"},
-            "occ.gov": {"delay": 2.0, "concurrency": 1, "type": "static"},
-        }
-
-    def _get_domain_config(self, domain: str) -> dict[str, Any]:
+    def _get_domain_config(self, domain: str) -> Mapping[str, Any]:
         """Get configuration for a domain, falling back to conservative defaults if not found."""
         domain_config = self._site_overrides.get(domain)
         if domain_config is not None:
@@ -67,7 +111,7 @@ class BatchScraper:
             return conservative_defaults
 
         # Final fallback if no wildcard is defined
-        return {"delay": 3.0, "concurrency": 1, "type": "static"}
+        return _FALLBACK_SITE_CONFIG
 
     async def scrape_urls(
         self,
@@ -77,100 +121,174 @@ class BatchScraper:
         max_concurrent: int = 10,
         save_individually: bool = False,
     ) -> list[dict[str, Any]]:
-        """Scrape multiple URLs with proper rate limiting."""
+        """Scrape multiple URLs with proper rate limiting.
+
+        output_format is "json", "jsonl" or "text". Prefer "jsonl" for batches of more than
+        ~100 URLs: each record is one line, so downstream code can parse it incrementally.
+
+        Results are returned in input order, one record per URL. When output_dir is given,
+        each result is written as soon as it completes and the returned records are summaries:
+        'text' is emptied and 'path' points to the saved file. Outcome counts are available
+        afterwards in last_summary, so callers need not re-filter the results. Repeated URLs
+        (differing only in scheme/host case or fragment) are scraped once; each gets a copy of the
+        record, which is also written to disk under its own index.
+        """
         logger.info("🚀 Starting batch scraping of %d URLs", len(urls))
 
-        # Group URLs by domain for better logging
-        domain_counts = self._count_urls_by_domain(urls)
-        for domain, count in domain_counts.items():
+        # Group URLs into per-domain queues in a single pass; queue lengths double as counts
+        domain_queues: list[tuple[deque[tuple[int, str]], int]] = []
+        queues_by_domain, repeats = self._queue_urls_by_domain(urls)
+        if repeats:
+            logger.info("📊 Skipping %d duplicate URLs", sum(len(copies) for copies in repeats.values()))
+        for domain, queue in queues_by_domain.items():
             domain_config = self._get_domain_config(domain)
             delay = domain_config.get("delay", 2.0)
             concurrency = domain_config.get("concurrency", 2)
-            logger.info("📊 Domain %s: %d URLs (delay=%.1fs, concurrency=%d)", domain, count, delay, concurrency)
+            logger.info("📊 Domain %s: %d URLs (delay=%.1fs, concurrency=%d)", domain, len(queue), delay, concurrency)
+            domain_queues.append((queue, concurrency))
+
+        # Set up throttling for every domain before the first request rather than on first hit
+        self._downloader_factory.prepare_domains(queues_by_domain)
 
         # Create semaphore for global concurrency control
         global_semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Stream results to disk as they complete instead of buffering every text
+        writer = _ResultWriter(output_dir, output_format, save_individually) if output_dir else None
+        if writer is not None:
+            await writer.open()
+
         # Process all URLs concurrently with shared throttling
         start_time = time.time()
 
-        tasks = [self._scrape_single_url(url, global_semaphore, idx) for idx, url in enumerate(urls)]
+        # Results are stored at their input index as workers complete them, and counted as they land
+        processed_results: list[dict[str, Any]] = [{}] * len(urls)
+        counts = {"success": 0, "errors": 0}
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Workers are spawned, not forked: a fork would inherit cached thread pools (such as the
+        # OCR pool) without their threads, and tasks submitted to them would never run
+        extraction_pool = ProcessPoolExecutor(max_workers=self._extraction_workers, mp_context=multiprocessing.get_context("spawn"))
 
-        total_time = time.time() - start_time
+        try:
+            # One FIFO queue per domain, drained by as many workers as the domain allows, so
+            # a long run of URLs for one domain cannot hold global slots needed by others
+            async with asyncio.TaskGroup() as task_group:
+                for queue, concurrency in domain_queues:
+                    for _ in range(max(1, min(concurrency, len(queue)))):
+                        task_group.create_task(
+                            self._domain_worker(queue, global_semaphore, extraction_pool, writer, repeats, processed_results, counts)
+                        )
+        finally:
+            # Joining the worker processes blocks, so it happens off the event loop
+            await asyncio.to_thread(extraction_pool.shutdown)
+            if writer is not None:
+                await writer.close()
+            await self._downloader_factory.aclose()
 
-        # Process results
-        processed_results: list[dict[str, Any]] = []
-        success_count = 0
-        error_count = 0
-
-        for idx, result in enumerate(results):
-            processed_result: dict[str, Any]
-            if isinstance(result, Exception):
-                logger.error("❌ URL %d failed with exception: %s", idx, result)
-                processed_result = {"url": urls[idx], "success": False, "error": str(result), "text": "", "metadata": {}}
-                error_count += 1
-            else:
-                # result is guaranteed to be dict[str, Any] here
-                processed_result = result  # type: ignore[assignment]
-                if processed_result.get("success", False):
-                    success_count += 1
-                else:
-                    error_count += 1
+        total_time = time.time() - start_time
 
-            processed_results.append(processed_result)
+        self.last_summary = {"total": len(urls), **counts, "elapsed": total_time}
 
         # Log summary
-        logger.info("📊 Batch completed in %.2fs: %d success, %d errors", total_time, success_count, error_count)
+        logger.info("📊 Batch completed in %.2fs: %d success, %d errors", total_time, counts["success"], counts["errors"])
         logger.info("📊 Average time per URL: %.2fs", total_time / len(urls))
 
-        # Save results if requested
-        if output_dir:
-            await self._save_results(processed_results, output_dir, output_format, save_individually)
-
         return processed_results
 
-    async def _scrape_single_url(self, url: str, global_semaphore: asyncio.Semaphore, idx: int) -> dict[str, Any]:
+    async def _domain_worker(
+        self,
+        queue: deque[tuple[int, str]],
+        global_semaphore: asyncio.Semaphore,
+        extraction_pool: Executor,
+        writer: "_ResultWriter | None",
+        repeats: Mapping[int, list[tuple[int, str]]],
+        results: list[dict[str, Any]],
+        counts: dict[str, int],
+    ) -> None:
+        """Drain one domain's URL queue, storing each result (and its repeats) at its input index."""
+        while queue:
+            idx, url = queue.popleft()
+            records = await self._scrape_and_write(url, global_semaphore, extraction_pool, idx, writer, repeats.get(idx, []))
+            for record_idx, record in records:
+                results[record_idx] = record
+                counts["success" if record.get("success", False) else "errors"] += 1
+
+    async def _scrape_and_write(
+        self,
+        url: str,
+        global_semaphore: asyncio.Semaphore,
+        extraction_pool: Executor,
+        idx: int,
+        writer: "_ResultWriter | None",
+        repeats: list[tuple[int, str]],
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Scrape a single URL and stream its result to disk, keeping only a summary in memory.
+
+        Repeats of the URL get a copy of the result under their own index and spelling of the URL.
+        """
+        # Any failure becomes this URL's error record instead of cancelling the other domain workers
+        try:
+            result = await self._scrape_single_url(url, global_semaphore, idx, extraction_pool)
+        except Exception as e:
+            logger.exception("❌ URL %d failed with exception", idx)
+            result = {"url": url, "success": False, "error": str(e), "text": "", "metadata": {}}
+
+        records = [(idx, result), *((repeat_idx, {**result, "url": repeat_url}) for repeat_idx, repeat_url in repeats)]
+        if writer is None:
+            return records
+        return [(record_idx, await self._write_result(writer, record_idx, record)) for record_idx, record in records]
+
+    async def _write_result(self, writer: "_ResultWriter", idx: int, result: dict[str, Any]) -> dict[str, Any]:
+        """Stream a result to disk, returning the summary kept in memory."""
+        # A failed write fails only this record, not the whole batch
+        try:
+            path = await writer.write(idx, result)
+        except Exception as e:
+            logger.exception("❌ URL %d failed with exception", idx)
+            return {"url": result["url"], "success": False, "error": str(e), "text": "", "metadata": {}}
+
+        # The text now lives on disk; drop it from the in-memory record
+        return {**result, "text": "", "path": str(path)}
+
+    async def _scrape_single_url(
+        self, url: str, global_semaphore: asyncio.Semaphore, idx: int, extraction_pool: Executor
+    ) -> dict[str, Any]:
         """Scrape a single URL with shared throttling."""
+        # Checked once per URL so disabled debug logging costs nothing below
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         async with global_semaphore:
             try:
-                logger.debug("⬇️  [%d] Processing: %s", idx, url)
+                if debug:
+                    logger.debug("⬇️  [%d] Processing: %s", idx, url)
 
-                # Use shared factory (with shared throttler)
+                # The factory hands out one shared downloader per site type (with shared throttler)
                 downloader = self._downloader_factory.create_downloader(url)
-                extractor = self._extractor_factory.create_extractor(url)
 
                 # Download with domain-specific throttling
                 download_result = await downloader.download(url)
-                logger.debug("✅ [%d] Downloaded %d bytes", idx, len(download_result.content))
-
-                # Extract content
-                extraction_result = await extractor.extract(download_result)
-                logger.debug("✅ [%d] Extracted %d chars", idx, len(extraction_result.text))
-
-                # Safely handle metadata
-                metadata_dict = {}
-                try:
-                    metadata = getattr(extraction_result, "metadata", {})
-                    if metadata:
-                        metadata_json = json.dumps(metadata, default=str)
-                        metadata_dict = json.loads(metadata_json)
-                except (ValueError, TypeError, AttributeError):
-                    metadata_dict = {"error": "metadata not serializable"}
+                if debug:
+                    logger.debug("✅ [%d] Downloaded %d bytes", idx, len(download_result.content))
+
+                # Extract content in the process pool (CPU-bound) while other downloads proceed
+                text, metadata_dict = await asyncio.get_running_loop().run_in_executor(
+                    extraction_pool, _extract_in_worker, download_result.content, download_result.content_type or "", url
+                )
+                if debug:
+                    logger.debug("✅ [%d] Extracted %d chars", idx, len(text))
 
                 return {
                     "url": url,
                     "success": True,
                     "error": "",
-                    "text": extraction_result.text,
+                    "text": text,
                     "metadata": metadata_dict,
                     "content_type": download_result.content_type,
                     "content_length": len(download_result.content),
-                    "text_length": len(extraction_result.text),
+                    "text_length": len(text),
                 }
 
-            except (ValueError, RuntimeError, OSError, ConnectionError, TimeoutError) as e:
+            except (httpx.HTTPError, ValueError, RuntimeError, OSError, ConnectionError, TimeoutError) as e:
                 logger.warning("❌ [%d] Failed %s: %s", idx, url, e)
                 return {
                     "url": url,
@@ -183,52 +301,139 @@ class BatchScraper:
                     "text_length": 0,
                 }
 
-    def _count_urls_by_domain(self, urls: list[str]) -> dict[str, int]:
-        """Count URLs by domain for logging."""
-        domain_counts: dict[str, int] = {}
-        for url in urls:
+    def _queue_urls_by_domain(self, urls: list[str]) -> tuple[dict[str, deque[tuple[int, str]]], dict[int, list[tuple[int, str]]]]:
+        """Group (index, URL) pairs into per-domain FIFO queues, setting aside repeated URLs.
+
+        Returns the queues and, keyed by first index, the (index, URL) pairs that were set aside.
+        """
+        domain_queues: dict[str, deque[tuple[int, str]]] = {}
+        first_seen: dict[str, int] = {}
+        repeats: dict[int, list[tuple[int, str]]] = {}
+        for idx, url in enumerate(urls):
             try:
-                domain = urlparse(url).netloc.lower()
-                domain_counts[domain] = domain_counts.get(domain, 0) + 1
+                domain = get_domain(url)
+                key = normalize_url(url)
             except (ValueError, AttributeError):
-                domain_counts["invalid"] = domain_counts.get("invalid", 0) + 1
-        return domain_counts
-
-    async def _save_results(self, results: list[dict[str, Any]], output_dir: Path, output_format: str, save_individually: bool) -> None:
-        """Save results to files."""
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        if save_individually:
-            # Save each result as separate file
-            for idx, result in enumerate(results):
-                filename = f"result_{idx:04d}_{self._sanitize_filename(result['url'])}"
-                if output_format == "json":
-                    filepath = output_dir / f"{filename}.json"
-                    filepath.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
-                else:
-                    filepath = output_dir / f"{filename}.txt"
-                    filepath.write_text(result["text"], encoding="utf-8")
-
-            logger.info("💾 Saved %d individual files to %s", len(results), output_dir)
+                domain, key = "invalid", url
+
+            first_idx = first_seen.setdefault(key, idx)
+            if first_idx != idx:
+                repeats.setdefault(first_idx, []).append((idx, url))
+                continue
+            domain_queues.setdefault(domain, deque()).append((idx, url))
+        return domain_queues, repeats
+
+
+class _ResultWriter:
+    """Writes batch results to disk as soon as each URL completes."""
+
+    def __init__(self, output_dir: Path, output_format: str, save_individually: bool) -> None:
+        self._output_dir = output_dir
+        self._output_format = output_format
+        self._save_individually = save_individually
+        self._is_json = output_format in {"json", "jsonl"}
+        self._combined_path = output_dir / f"batch_results.{output_format if self._is_json else 'txt'}"
+        self._combined_file: IO[Any] | None = None
+        self._records_written = 0
+        # Serializes appends to the combined file
+        self._lock = asyncio.Lock()
+        # Bounds parallel individual-file writes
+        self._write_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+    async def open(self) -> None:
+        """Create the output directory and, for combined output, open the results file."""
+        await asyncio.to_thread(self._output_dir.mkdir, parents=True, exist_ok=True)
+
+        if not self._save_individually:
+            if self._is_json:
+                # JSON records arrive as UTF-8 bytes, so the file is written in binary mode
+                combined_file = await asyncio.to_thread(self._combined_path.open, "wb")
+                self._combined_file = combined_file
+                if self._output_format == "json":
+                    await asyncio.to_thread(combined_file.write, b"[\n")
+            else:
+                self._combined_file = await asyncio.to_thread(self._combined_path.open, "w", encoding="utf-8")
+
+    async def write(self, idx: int, result: dict[str, Any]) -> Path:
+        """Write a single result and return the path it was written to."""
+        if self._save_individually:
+            return await self._write_individual(idx, result)
+        return await self._write_combined(result)
+
+    async def close(self) -> None:
+        """Finish the combined results file and log where results were saved."""
+        if self._combined_file is None:
+            logger.info("💾 Saved %d individual files to %s", self._records_written, self._output_dir)
+            return
+
+        if self._output_format == "json":
+            await asyncio.to_thread(self._combined_file.write, b"\n]")
+        await asyncio.to_thread(self._combined_file.close)
+        self._combined_file = None
+
+        logger.info("💾 Saved batch results to %s", self._combined_path)
+
+    async def _write_individual(self, idx: int, result: dict[str, Any]) -> Path:
+        """Save a result as its own file."""
+        filename = f"result_{idx:04d}_{_sanitize_filename(result['url'])}"
+        if self._is_json:
+            filepath = self._output_dir / f"{filename}.json"
+            content = dumps_bytes(result, indent=self._output_format == "json")
         else:
-            # Save all results in one file
-            if output_format == "json":
-                filepath = output_dir / "batch_results.json"
-                filepath.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+            filepath = self._output_dir / f"{filename}.txt"
+            content = result["text"].encode("utf-8")
+
+        async with self._write_semaphore:
+            await asyncio.to_thread(_write_file_bytes, filepath, content)
+        self._records_written += 1
+        return filepath
+
+    async def _write_combined(self, result: dict[str, Any]) -> Path:
+        """Append a result to the combined results file (in completion order)."""
+        if not self._is_json and not result["success"]:
+            # Only successful extractions go into the combined text file
+            return self._combined_path
+
+        record = dumps_bytes(result, indent=self._output_format == "json") if self._is_json else b""
+
+        combined_file = self._combined_file
+        assert combined_file is not None, "open() must be called before writing combined results"
+
+        async with self._lock:
+            pieces: list[bytes] | list[str]
+            if self._output_format == "jsonl":
+                # One compact record per line, so readers can stream the file
+                pieces = [record, b"\n"]
+            elif self._output_format == "json":
+                pieces = [b",\n" if self._records_written else b"", record]
             else:
-                filepath = output_dir / "batch_results.txt"
-                text_content = "\n\n" + "=" * 80 + "\n\n".join(f"URL: {r['url']}\n\n{r['text']}" for r in results if r["success"])
-                filepath.write_text(text_content, encoding="utf-8")
+                # Written piecewise so the (possibly large) text is never copied into a new string
+                pieces = [_TEXT_SEPARATOR, f"URL: {result['url']}\n\n", result["text"]]
 
-            logger.info("💾 Saved batch results to %s", filepath)
+            await asyncio.to_thread(combined_file.writelines, pieces)
+            self._records_written += 1
 
-    def _sanitize_filename(self, url: str) -> str:
-        """Sanitize URL for filename."""
-        try:
-            domain = urlparse(url).netloc.lower()
-            return domain.replace(".", "_")
-        except (ValueError, AttributeError):
-            return "unknown"
+        return self._combined_path
+
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file with raw OS calls (runs in a worker thread)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _sanitize_filename(url: str) -> str:
+    """Sanitize URL for filename."""
+    try:
+        domain = get_domain(url)
+        return domain.replace(".", "_")
+    except (ValueError, AttributeError):
+        return "unknown"
 
 
 # Convenience function for simple batch processing
@@ -1,17 +1,19 @@
+from collections.abc import Iterable, Mapping
+from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse
 
 from regscraper.infrastructure import (
     DomainThrottler,
     RobotsTxtChecker,
     ThrottledRobotsChecker,
+    get_domain,
 )
 from regscraper.interfaces import Downloader
 
 from .http import HttpDownloader
 from .playwright import PlaywrightDownloader
 
-SiteConfig = dict[str, dict[str, Any]]
+SiteConfig = Mapping[str, Mapping[str, Any]]
 
 
 class DownloaderFactory:
@@ -23,12 +25,13 @@ class DownloaderFactory:
         default_delay: float = 2.0,
         default_concurrency: int = 2,
         user_agent: str = "RegScraper/2.0",
+        robots_cache_dir: str | Path | None = None,
     ) -> None:
         self._site_overrides = site_overrides
         self._user_agent = user_agent
 
         # Create shared infrastructure
-        self._robots_checker = RobotsTxtChecker(user_agent)
+        self._robots_checker = RobotsTxtChecker(user_agent, cache_dir=robots_cache_dir)
         self._throttler = DomainThrottler(default_delay, default_concurrency)
 
         # Configure domain-specific throttling
@@ -37,19 +40,46 @@ class DownloaderFactory:
         # Create compliance checker
         self._compliance_checker = ThrottledRobotsChecker(self._robots_checker, self._throttler)
 
+        # One downloader per site type, so connection pools persist across URLs
+        self._downloaders: dict[str, Downloader] = {}
+
     def create_downloader(self, url: str) -> Downloader:
-        """Create appropriate downloader based on URL and site configuration."""
+        """Return the shared downloader for the URL's site type, creating it on first use."""
         domain = self._get_domain(url)
         site_config = self._get_domain_config(domain)
 
         # Determine if site needs dynamic downloading
-        site_type = site_config.get("type", "static")
-
-        if site_type == "dynamic":
-            return PlaywrightDownloader(compliance_checker=self._compliance_checker, user_agent=self._user_agent)
-        return HttpDownloader(compliance_checker=self._compliance_checker, user_agent=self._user_agent)
-
-    def _get_domain_config(self, domain: str) -> dict[str, Any]:
+        site_type = "dynamic" if site_config.get("type", "static") == "dynamic" else "static"
+
+        downloader = self._downloaders.get(site_type)
+        if downloader is None:
+            if site_type == "dynamic":
+                downloader = PlaywrightDownloader(compliance_checker=self._compliance_checker, user_agent=self._user_agent)
+            else:
+                downloader = HttpDownloader(compliance_checker=self._compliance_checker, user_agent=self._user_agent)
+            self._downloaders[site_type] = downloader
+        return downloader
+
+    def prepare_domains(self, domains: Iterable[str]) -> None:
+        """Create throttling state for domains up front.
+
+        Domains with a site override use its settings; all others get the throttler's defaults,
+        exactly as if the state had been created on their first request.
+        """
+        for domain in domains:
+            config = self._site_overrides.get(domain)
+            if config is None:
+                self._throttler.ensure_domain(domain)
+            else:
+                self._throttler.ensure_domain(domain, config.get("delay"), config.get("concurrency"))
+
+    async def aclose(self) -> None:
+        """Release the connections held by all created downloaders and the robots.txt checker."""
+        for downloader in self._downloaders.values():
+            await downloader.aclose()
+        await self._robots_checker.aclose()
+
+    def _get_domain_config(self, domain: str) -> Mapping[str, Any]:
         """Get configuration for a domain, falling back to conservative defaults if not found."""
         domain_config = self._site_overrides.get(domain)
         if domain_config is not None:
@@ -65,7 +95,7 @@ class DownloaderFactory:
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        return urlparse(url).netloc.lower()
+        return get_domain(url)
 
     def _configure_domain_throttling(self) -> None:
         """Configure throttling for specific domains."""
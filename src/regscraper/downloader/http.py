@@ -1,9 +1,54 @@
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from regscraper.infrastructure import ThrottledRobotsChecker
 from regscraper.interfaces import Downloader, DownloadResult
 
+# Statuses worth retrying: rate limiting and transient server or gateway failures
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest Retry-After we honor; beyond that the attempt is better given up than blocked on
+_MAX_RETRY_AFTER = 60.0
+
+_backoff = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Check whether a download failure may succeed on retry."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse a response's Retry-After header (delay seconds or HTTP date) into seconds."""
+    value = response.headers.get("retry-after", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # A "-0000" zone parses to a naive datetime; HTTP dates are always UTC
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """Wait as long as the server asked via Retry-After, otherwise back off exponentially."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError):
+        delay = _retry_after(exc.response)
+        if delay is not None:
+            return min(delay, _MAX_RETRY_AFTER)
+    return _backoff(retry_state)
+
 
 class HttpDownloader(Downloader):
     """HTTP downloader with robots.txt compliance and throttling."""
@@ -17,26 +62,55 @@ class HttpDownloader(Downloader):
         self._compliance_checker = compliance_checker
         self._timeout = timeout
         self._user_agent = user_agent
+        self._limits = httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30)
+
+        # Shared across downloads for keep-alive; created lazily so it binds to the running loop
+        self._client: httpx.AsyncClient | None = None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client; a new one is created on the next download."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                headers={"User-Agent": self._user_agent},
+                follow_redirects=True,
+                limits=self._limits,
+                # Concurrent requests to one host share a multiplexed connection where the server supports it
+                http2=True,
+            )
+        return self._client
+
+    @retry(stop=stop_after_attempt(3), wait=_wait_for_retry, retry=retry_if_exception(_is_transient), reraise=True)
     async def download(self, url: str) -> DownloadResult:
-        """Download content with compliance checks and retry logic."""
+        """Download content with compliance checks and retry logic.
+
+        Only transient failures (rate limiting, 5xx, connection errors and timeouts) are retried;
+        robots.txt refusals and other client errors fail on the first attempt.
+        """
         # Check robots.txt and acquire throttling lock
         await self._compliance_checker.check_and_acquire(url)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self._timeout,
-                headers={"User-Agent": self._user_agent},
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            try:
+                response = await self._get_client().get(url)
+            except httpx.TransportError:
+                # No response at all (timeout, refused or reset connection) still counts against the domain
+                self._compliance_checker.record_response(url, None)
+                raise
+
+            self._compliance_checker.record_response(url, response.status_code)
+            response.raise_for_status()
 
-                # Extract content type
-                content_type = response.headers.get("content-type", "").split(";")[0]
+            # Extract content type
+            content_type = response.headers.get("content-type", "").split(";")[0]
 
-                return DownloadResult(content=response.content, content_type=content_type, url=url)
+            return DownloadResult(content=response.content, content_type=content_type, url=url)
 
         finally:
             # Always release throttling resources
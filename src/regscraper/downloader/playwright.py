@@ -1,4 +1,12 @@
-from playwright.async_api import async_playwright
+import asyncio
+from typing import Self
+
+from playwright.async_api import (
+    Browser,
+    Playwright,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+)
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from regscraper.infrastructure import ThrottledRobotsChecker
@@ -18,6 +26,33 @@ class PlaywrightDownloader(Downloader):
         self._timeout = timeout * 1000  # Playwright uses milliseconds
         self._user_agent = user_agent
 
+        # One browser process is shared by all downloads; each URL gets its own context
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._start_lock = asyncio.Lock()
+
+    async def start(self) -> Browser:
+        """Launch the shared browser if it is not already running."""
+        async with self._start_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def aclose(self) -> None:
+        """Close the shared browser and stop Playwright; the next download relaunches it."""
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+
     @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=3, max=30))
     async def download(self, url: str) -> DownloadResult:
         """Download dynamic content using Playwright."""
@@ -25,22 +60,28 @@ class PlaywrightDownloader(Downloader):
         await self._compliance_checker.check_and_acquire(url)
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page(user_agent=self._user_agent)
+            browser = await self.start()
+            context = await browser.new_context(user_agent=self._user_agent)
 
+            try:
+                page = await context.new_page()
                 try:
-                    await page.goto(url, wait_until="networkidle", timeout=self._timeout)
-                    content_html = await page.content()
+                    response = await page.goto(url, wait_until="networkidle", timeout=self._timeout)
+                except PlaywrightTimeoutError:
+                    self._compliance_checker.record_response(url, None)
+                    raise
+
+                self._compliance_checker.record_response(url, response.status if response else None)
+                content_html = await page.content()
 
-                    return DownloadResult(
-                        content=content_html.encode("utf-8"),
-                        content_type="text/html",
-                        url=url,
-                    )
+                return DownloadResult(
+                    content=content_html.encode("utf-8"),
+                    content_type="text/html",
+                    url=url,
+                )
 
-                finally:
-                    await browser.close()
+            finally:
+                await context.close()
 
         finally:
             # Always release throttling resources
@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import io
+import zipfile
 
 import mammoth  # type: ignore[import-untyped]
 from docx import Document as DocxDocument  # type: ignore[import-untyped]
+from lxml import etree  # type: ignore[import-untyped]
 
 from regscraper.interfaces import ContentType, DownloadResult, ExtractionResult, TextExtractor
 
+# DOC files typically start with an OLE2 compound file or Word 6 signature
+_DOC_SIGNATURES = (
+    b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",  # OLE2 signature
+    b"\xdb\xa5-\x00\x00\x00",  # Alternative DOC signature
+)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PARAGRAPH, _TEXT, _TAB, _BREAK, _CARRIAGE_RETURN = f"{_W}p", f"{_W}t", f"{_W}tab", f"{_W}br", f"{_W}cr"
+# Markup-compatibility fallbacks repeat the content of their mc:Choice (e.g. text boxes for older Word)
+_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
 
 class DocxTextExtractor(TextExtractor):
     """Extracts text from DOCX and DOC documents."""
 
     async def extract(self, download_result: DownloadResult) -> ExtractionResult:
         """Extract text from DOCX/DOC content."""
+        # Parsing is CPU-bound, so it runs in a worker thread to keep the event loop responsive
+        return await asyncio.to_thread(self._extract_sync, download_result)
+
+    def _extract_sync(self, download_result: DownloadResult) -> ExtractionResult:
+        """Extract text from DOCX/DOC content (blocking)."""
         metadata: dict[str, int | str] = {"format": "unknown", "paragraphs": 0}
 
         try:
@@ -30,14 +49,18 @@ class DocxTextExtractor(TextExtractor):
                 if result.messages:  # type: ignore[misc]
                     metadata["conversion_warnings"] = len(result.messages)  # type: ignore[misc]
             else:
-                # Use python-docx for .docx files
-                doc = DocxDocument(content_stream)  # type: ignore[misc]
-                paragraphs = [p.text for p in doc.paragraphs if p.text and p.text.strip()]  # type: ignore[misc]
+                try:
+                    paragraphs = _stream_docx_paragraphs(content_stream)
+                except (KeyError, etree.XMLSyntaxError):
+                    # Fall back to python-docx for packages the streaming parser cannot read
+                    content_stream.seek(0)
+                    doc = DocxDocument(content_stream)  # type: ignore[misc]
+                    paragraphs = [p.text for p in doc.paragraphs if p.text and p.text.strip()]  # type: ignore[misc]
                 text = "\n".join(paragraphs)
                 metadata["format"] = "docx"
                 metadata["paragraphs"] = len(paragraphs)
 
-        except (OSError, ValueError) as e:
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
             msg = f"DOCX text extraction failed: {e}"
             raise RuntimeError(msg) from e
 
@@ -49,10 +72,49 @@ class DocxTextExtractor(TextExtractor):
 
     def _is_legacy_doc_format(self, content: bytes) -> bool:
         """Heuristic to detect legacy DOC format."""
-        # DOC files typically start with specific signatures
-        doc_signatures = [
-            b"\\xd0\\xcf\\x11\\xe0\\xa1\\xb1\\x1a\\xe1",  # OLE2 signature
-            b"\\xdb\\xa5-\\x00\\x00\\x00",  # Alternative DOC signature
-        ]
+        # Only the leading signature bytes are needed, however large the download
+        return content[:8].startswith(_DOC_SIGNATURES)
+
+
+def _stream_docx_paragraphs(content_stream: io.BytesIO) -> list[str]:
+    """Read non-empty paragraph texts straight from word/document.xml without building a document model.
+
+    Paragraphs nested in another one (text boxes) come out as paragraphs of their own, ahead of
+    the paragraph that holds them; mc:Fallback copies of content are skipped.
+    """
+    paragraphs: list[str] = []
+    # Text parts of each paragraph being read, innermost last
+    open_paragraphs: list[list[str]] = []
+    fallback_depth = 0
+
+    with zipfile.ZipFile(content_stream) as package, package.open("word/document.xml") as document_xml:
+        for event, element in etree.iterparse(
+            document_xml,
+            events=("start", "end"),
+            tag=(_PARAGRAPH, _TEXT, _TAB, _BREAK, _CARRIAGE_RETURN, _FALLBACK),
+            resolve_entities=False,
+        ):
+            tag = element.tag
+            if tag == _FALLBACK:
+                fallback_depth += 1 if event == "start" else -1
+            elif fallback_depth:
+                continue
+            elif tag == _PARAGRAPH:
+                if event == "start":
+                    open_paragraphs.append([])
+                    continue
+                paragraph = "".join(open_paragraphs.pop())
+                if paragraph.strip():
+                    paragraphs.append(paragraph)
+                # Release the parsed paragraph so memory stays flat on long documents
+                element.clear()
+            elif event == "end" and open_paragraphs:
+                parts = open_paragraphs[-1]
+                if tag == _TEXT:
+                    parts.append(element.text or "")
+                elif tag == _TAB:
+                    parts.append("\t")
+                else:
+                    parts.append("\n")
 
-        return any(content.startswith(sig) for sig in doc_signatures)
+    return paragraphs
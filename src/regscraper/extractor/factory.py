@@ -1,11 +1,27 @@
 from __future__ import annotations
 
+import re
+
 from regscraper.interfaces import ContentType, TextExtractor
 
 from .docx import DocxTextExtractor
 from .html import HtmlTextExtractor
 from .pdf import PdfTextExtractor
 
+_RSS_URL_RE = re.compile(r"\.rss|/feed|/rss")
+
+# Exact MIME types resolved with one lookup; anything else goes through the substring rules
+_MIME_TYPES: dict[str, ContentType] = {
+    "application/pdf": ContentType.PDF,
+    "application/msword": ContentType.DOCX,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ContentType.DOCX,
+    "application/rss+xml": ContentType.RSS,
+    "application/atom+xml": ContentType.RSS,
+    "application/xml": ContentType.RSS,
+    "text/xml": ContentType.RSS,
+    "text/html": ContentType.HTML,
+}
+
 
 class ExtractorFactory:
     """Factory for creating text extractors based on content type."""
@@ -36,25 +52,29 @@ class ExtractorFactory:
             return ContentType.PDF
         if url_lower.endswith((".docx", ".doc")):
             return ContentType.DOCX
-        if any(indicator in url_lower for indicator in [".rss", "/feed", "/rss"]):
+        if _RSS_URL_RE.search(url_lower):
             return ContentType.RSS
 
         # Then try HTTP content-type header
-        if content_type:
-            content_type_lower = content_type.lower()
-
-            if "pdf" in content_type_lower:
-                return ContentType.PDF
-            if any(doc_type in content_type_lower for doc_type in ["msword", "wordprocessingml"]):
-                return ContentType.DOCX
-            if any(rss_type in content_type_lower for rss_type in ["rss", "xml", "atom"]):
-                return ContentType.RSS
-            if "html" in content_type_lower:
-                return ContentType.HTML
-
-        # Default to HTML for ambiguous cases
-        return ContentType.HTML
+        return _content_type_from_header(content_type.lower())
 
     def register_extractor(self, content_type: ContentType, extractor: TextExtractor) -> None:
         """Register a custom extractor for a content type."""
         self._extractors[content_type] = extractor
+
+
+def _content_type_from_header(content_type_lower: str) -> ContentType:
+    """Map a lowercased HTTP content-type header to a content type, defaulting to HTML."""
+    mime_type = _MIME_TYPES.get(content_type_lower.split(";", 1)[0].strip())
+    if mime_type is not None:
+        return mime_type
+
+    if "pdf" in content_type_lower:
+        return ContentType.PDF
+    if "msword" in content_type_lower or "wordprocessingml" in content_type_lower:
+        return ContentType.DOCX
+    if "rss" in content_type_lower or "xml" in content_type_lower or "atom" in content_type_lower:
+        return ContentType.RSS
+
+    # Default to HTML for ambiguous cases
+    return ContentType.HTML
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import re
 
 import trafilatura
 
 from regscraper.interfaces import ContentType, DownloadResult, ExtractionResult, TextExtractor
 
+# Try to import selectolax - it's optional, and much faster than BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore[import-not-found]
+
+    _has_selectolax = True
+except ImportError:
+    LexborHTMLParser = None  # type: ignore[misc,assignment]
+    _has_selectolax = False
+
 # Try to import BeautifulSoup - it's optional
 try:
     from bs4 import BeautifulSoup  # type: ignore[import-untyped]
@@ -15,12 +25,20 @@ except ImportError:
     BeautifulSoup = None  # type: ignore[misc,assignment]
     _has_beautifulsoup = False
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class HtmlTextExtractor(TextExtractor):
     """Extracts clean text from HTML documents."""
 
     async def extract(self, download_result: DownloadResult) -> ExtractionResult:
         """Extract clean text from HTML content using trafilatura."""
+        # Parsing is CPU-bound, so it runs in a worker thread to keep the event loop responsive
+        return await asyncio.to_thread(self._extract_sync, download_result)
+
+    def _extract_sync(self, download_result: DownloadResult) -> ExtractionResult:
+        """Extract clean text from HTML content using trafilatura (blocking)."""
         try:
             html_content = download_result.content.decode("utf-8", errors="ignore")
 
@@ -55,6 +73,16 @@ class HtmlTextExtractor(TextExtractor):
 
     def _basic_html_extraction(self, html_content: str) -> str:
         """Basic HTML text extraction as fallback."""
+        if _has_selectolax:
+            tree = LexborHTMLParser(html_content)  # type: ignore[misc]
+
+            # Remove script and style elements
+            for node in tree.css("script, style"):  # type: ignore[misc]
+                node.decompose()  # type: ignore[misc]
+
+            root = tree.body or tree.root  # type: ignore[misc]
+            return root.text(separator="\n", strip=True) if root is not None else ""  # type: ignore[misc]
+
         if _has_beautifulsoup:
             soup = BeautifulSoup(html_content, "html.parser")  # type: ignore[misc]
 
@@ -64,13 +92,13 @@ class HtmlTextExtractor(TextExtractor):
 
             return soup.get_text(separator="\n", strip=True)  # type: ignore[misc]
 
-        # If BeautifulSoup is not available, use regex extraction
+        # If no HTML parser is available, use regex extraction
         return self._regex_html_extraction(html_content)
 
     def _regex_html_extraction(self, html_content: str) -> str:
         """Very basic HTML text extraction using regex."""
         # Remove HTML tags (very basic approach)
-        clean_text = re.sub(r"<[^>]+>", " ", html_content)
+        clean_text = _TAG_RE.sub(" ", html_content)
         # Clean up whitespace
-        clean_text = re.sub(r"\s+", " ", clean_text)
+        clean_text = _WHITESPACE_RE.sub(" ", clean_text)
         return clean_text.strip()
@@ -1,5 +1,6 @@
 from .domain import DomainThrottler
 from .robots import RobotsTxtChecker
 from .throttle import ThrottledRobotsChecker
+from .urls import get_domain, normalize_url
 
-__all__ = ["DomainThrottler", "RobotsTxtChecker", "ThrottledRobotsChecker"]
+__all__ = ["DomainThrottler", "RobotsTxtChecker", "ThrottledRobotsChecker", "get_domain", "normalize_url"]
@@ -1,40 +1,47 @@
 import asyncio
-import time
-from urllib.parse import urlparse
+from time import monotonic
+
+from .urls import get_domain
+
+# HTTP statuses that signal the server wants us to slow down
+_OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Smallest delay used when backing off a domain configured with no delay
+_MIN_BACKOFF_DELAY = 1.0
 
 
 class DomainThrottler:
-    """Per-domain rate limiting with semaphores."""
+    """Per-domain rate limiting with semaphores and adaptive (AIMD) delays."""
 
-    def __init__(self, default_delay: float = 2.0, default_concurrency: int = 2) -> None:
+    def __init__(self, default_delay: float = 2.0, default_concurrency: int = 2, max_delay: float = 60.0) -> None:
         self.default_delay = default_delay
         self.default_concurrency = default_concurrency
+        self.max_delay = max_delay
         self._domain_locks: dict[str, asyncio.Semaphore] = {}
         self._domain_delays: dict[str, float] = {}  # Store per-domain delays
+        self._adaptive_delays: dict[str, float] = {}  # Delays adjusted from server feedback
         self._last_request: dict[str, float] = {}
         self._global_semaphore = asyncio.Semaphore(10)  # Global limit
 
     async def acquire(self, url: str) -> None:
-        """Acquire throttling lock for URL's domain."""
-        domain = self._get_domain(url)
+        """Acquire throttling lock for URL's domain.
 
-        # Global throttling first
-        await self._global_semaphore.acquire()
+        The domain's delay is waited out before a global slot is taken, so one domain's
+        sleep never holds a slot that requests to other domains could be using.
+        """
+        domain = self._get_domain(url)
 
-        try:
-            # Domain-specific throttling
-            domain_lock = self._get_domain_lock(domain)
-            await domain_lock.acquire()
+        # Domain-specific throttling
+        async with self.ensure_domain(domain):
+            # Rate limiting
+            await self._enforce_delay(domain)
 
-            try:
-                # Rate limiting
-                await self._enforce_delay(domain)
-            finally:
-                domain_lock.release()
+            # Global throttling last, only once the request is ready to go
+            await self._global_semaphore.acquire()
 
-        except Exception:
-            self._global_semaphore.release()
-            raise
+            # Waiting for a global slot may have pushed this request past its reserved start;
+            # later requests to the domain are spaced from when it actually starts
+            self._last_request[domain] = max(self._last_request[domain], monotonic())
 
     def release_global(self) -> None:
         """Release global semaphore."""
@@ -44,27 +51,58 @@ class DomainThrottler:
         """Configure specific domain settings."""
         self._domain_locks[domain] = asyncio.Semaphore(concurrency)
         self._domain_delays[domain] = delay
+        self._adaptive_delays.pop(domain, None)
+
+    def ensure_domain(self, domain: str, delay: float | None = None, concurrency: int | None = None) -> asyncio.Semaphore:
+        """Create the domain's throttling state if it does not exist yet (idempotent).
+
+        Unlike configure_domain, existing state is left untouched, so this is safe to call
+        for every domain of a batch before any request is made.
+        """
+        domain_lock = self._domain_locks.get(domain)
+        if domain_lock is None:
+            domain_lock = self._domain_locks[domain] = asyncio.Semaphore(concurrency or self.default_concurrency)
+            if delay is not None:
+                self._domain_delays.setdefault(domain, delay)
+        return domain_lock
+
+    def record_response(self, url: str, status_code: int | None) -> None:
+        """Adapt the domain's delay to server feedback.
+
+        Overload signals (429, 5xx or no response at all) double the delay up to max_delay;
+        any other response shrinks it by 10%, never below the configured delay.
+        """
+        domain = self._get_domain(url)
+        base_delay = self._domain_delays.get(domain, self.default_delay)
+        delay = self._adaptive_delays.get(domain, base_delay)
+
+        if status_code is None or status_code in _OVERLOAD_STATUSES:
+            delay = min(max(delay * 2, base_delay, _MIN_BACKOFF_DELAY), self.max_delay)
+        else:
+            delay = max(delay * 0.9, base_delay)
+
+        self._adaptive_delays[domain] = delay
+
+    def get_delay(self, domain: str) -> float:
+        """Get the current delay for a domain."""
+        return self._adaptive_delays.get(domain, self._domain_delays.get(domain, self.default_delay))
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        return urlparse(url).netloc.lower()
-
-    def _get_domain_lock(self, domain: str) -> asyncio.Semaphore:
-        """Get or create semaphore for domain."""
-        if domain not in self._domain_locks:
-            self._domain_locks[domain] = asyncio.Semaphore(self.default_concurrency)
-        return self._domain_locks[domain]
+        return get_domain(url)
 
     async def _enforce_delay(self, domain: str) -> None:
         """Enforce delay between requests to same domain."""
-        now = time.time()
+        now = monotonic()
 
-        # Use domain-specific delay if configured, otherwise use default
-        delay = self._domain_delays.get(domain, self.default_delay)
+        # Use the adapted or configured domain delay, otherwise the default
+        delay = self.get_delay(domain)
 
-        if domain in self._last_request:
-            elapsed = now - self._last_request[domain]
-            if elapsed < delay:
-                await asyncio.sleep(delay - elapsed)
+        # Reserve this request's slot before sleeping (no await in between), so concurrent
+        # requests to the same domain queue up one delay apart instead of firing together
+        last_request = self._last_request.get(domain)
+        start_at = now if last_request is None else max(now, last_request + delay)
+        self._last_request[domain] = start_at
 
-        self._last_request[domain] = time.time()
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
@@ -1,17 +1,76 @@
-from collections import defaultdict
-from urllib.parse import urlparse
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol
 from urllib.robotparser import RobotFileParser
 
 import httpx
 
+from .urls import get_domain
+
+# Try to import Protego - it's optional, and matches rules faster (and per Google's spec)
+try:
+    from protego import Protego  # type: ignore[import-not-found]
+
+    _has_protego = True
+except ImportError:
+    Protego = None  # type: ignore[misc,assignment]
+    _has_protego = False
+
+_DEFAULT_CRAWL_DELAY = 2.0
+
+
+class _RobotsRules(Protocol):
+    """Parsed robots.txt rules, as exposed by RobotFileParser."""
+
+    def can_fetch(self, useragent: str, url: str) -> bool: ...
+
+
+class _ProtegoRules:
+    """RobotFileParser-compatible view of rules parsed by Protego."""
+
+    def __init__(self, robots_content: str) -> None:
+        self._rules = Protego.parse(robots_content)  # type: ignore[misc]
+
+    def can_fetch(self, useragent: str, url: str) -> bool:
+        return bool(self._rules.can_fetch(url, useragent))  # type: ignore[misc]
+
+    def crawl_delay(self, useragent: str) -> float | None:
+        return self._rules.crawl_delay(useragent)  # type: ignore[no-any-return]
+
 
 class RobotsTxtChecker:
     """Robots.txt compliance checker with caching."""
 
-    def __init__(self, user_agent: str = "RegScraper/2.0") -> None:
+    def __init__(
+        self,
+        user_agent: str = "RegScraper/2.0",
+        ttl: float = 6 * 60 * 60,
+        negative_ttl: float = 15 * 60,
+        max_domains: int = 1024,
+        cache_dir: str | Path | None = None,
+    ) -> None:
+        """Set up the checker; with cache_dir, found robots.txt files also persist there across runs for ttl seconds."""
         self.user_agent = user_agent
-        self._cache: dict[str, RobotFileParser] = {}
-        self._crawl_delays: dict[str, float] = defaultdict(lambda: 2.0)
+        self.ttl = ttl  # Seconds before a cached robots.txt is fetched again
+        self.negative_ttl = negative_ttl  # Shorter expiry when robots.txt was missing or unreachable
+        self.max_domains = max_domains
+        # LRU of domain -> (parser, expiry time on the monotonic clock)
+        self._cache: OrderedDict[str, tuple[_RobotsRules, float]] = OrderedDict()
+        self._fetch_locks: dict[str, asyncio.Lock] = {}
+        self._crawl_delays: dict[str, float] = {}  # Parsed once per fetch, evicted with the cache entry
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+        # Shared across fetches (HTTP/2 multiplexes domains behind the same CDN); created lazily
+        self._client: httpx.AsyncClient | None = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP client used for robots.txt fetches."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     async def is_allowed(self, url: str) -> bool:
         """Check if URL is allowed by robots.txt."""
@@ -26,11 +85,11 @@ class RobotsTxtChecker:
     def get_crawl_delay(self, url: str) -> float:
         """Get crawl delay for domain."""
         domain = self._get_domain(url)
-        return self._crawl_delays[domain]
+        return self._crawl_delays.get(domain, _DEFAULT_CRAWL_DELAY)
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        return urlparse(url).netloc.lower()
+        return get_domain(url)
 
     def _is_rss_feed(self, url: str) -> bool:
         """Check if URL appears to be an RSS feed."""
@@ -44,43 +103,131 @@ class RobotsTxtChecker:
             or "feed.xml" in url_lower
         )
 
-    async def _get_robots_parser(self, domain: str) -> RobotFileParser:
+    async def _get_robots_parser(self, domain: str) -> _RobotsRules:
         """Get robots.txt parser for domain (cached)."""
-        if domain in self._cache:
-            return self._cache[domain]
+        parser = self._get_cached_parser(domain)
+        if parser is not None:
+            return parser
+
+        # Concurrent first requests for a domain share a single fetch
+        lock = self._fetch_locks.get(domain)
+        if lock is None:
+            lock = self._fetch_locks[domain] = asyncio.Lock()
+        async with lock:
+            parser = self._get_cached_parser(domain)
+            if parser is None:
+                self._crawl_delays.pop(domain, None)  # A refreshed robots.txt may have dropped its crawl-delay
+
+                # A robots.txt saved by an earlier run saves the network round trip
+                saved = await asyncio.to_thread(self._read_saved_robots, domain) if self._cache_dir is not None else None
+                if saved is not None:
+                    robots_content, ttl = saved
+                    parser = self._parse_robots(domain, robots_content)
+                else:
+                    parser, found = await self._fetch_robots_parser(domain)
+                    ttl = self.ttl if found else min(self.negative_ttl, self.ttl)
+                self._store_parser(domain, parser, ttl)
+            return parser
+
+    def _get_cached_parser(self, domain: str) -> _RobotsRules | None:
+        """Get the cached parser for domain if it has not expired."""
+        cached = self._cache.get(domain)
+        if cached is None:
+            return None
+
+        parser, expires_at = cached
+        if time.monotonic() >= expires_at:
+            return None
+
+        self._cache.move_to_end(domain)
+        return parser
 
+    def _store_parser(self, domain: str, parser: _RobotsRules, ttl: float) -> None:
+        """Cache parser for domain, evicting the least recently used domains beyond max_domains."""
+        self._cache[domain] = (parser, time.monotonic() + ttl)
+        self._cache.move_to_end(domain)
+        while len(self._cache) > self.max_domains:
+            evicted, _ = self._cache.popitem(last=False)
+            self._crawl_delays.pop(evicted, None)
+            lock = self._fetch_locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._fetch_locks[evicted]
+
+    async def _fetch_robots_parser(self, domain: str) -> tuple[_RobotsRules, bool]:
+        """Fetch and parse robots.txt for domain; the flag tells whether a robots.txt was found."""
         robots_url = f"https://{domain}/robots.txt"
         parser = RobotFileParser()
         parser.set_url(robots_url)
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(robots_url, headers={"User-Agent": self.user_agent})
+            response = await self._get_client().get(robots_url)
 
-                if response.status_code == 200:
-                    lines = response.text.splitlines()
-                    parser.parse(lines)
-                    self._parse_crawl_delay(domain, response.text)
-                else:
-                    # Default: allow all
-                    parser.set_url(robots_url)
-                    parser.parse(["User-agent: *", "Allow: /"])
+            if response.status_code == 200:
+                robots_content = response.text
+                if self._cache_dir is not None:
+                    await asyncio.to_thread(self._save_robots, domain, robots_content)
+                return self._parse_robots(domain, robots_content), True
+
+            # Default: allow all
+            parser.set_url(robots_url)
+            parser.parse(["User-agent: *", "Allow: /"])
 
         except (httpx.RequestError, httpx.HTTPStatusError, TimeoutError):
             # Default: allow all on error
             parser.set_url(robots_url)
             parser.parse(["User-agent: *", "Allow: /"])
 
-        self._cache[domain] = parser
+        return parser, False
+
+    def _parse_robots(self, domain: str, robots_content: str) -> _RobotsRules:
+        """Parse robots.txt content for domain, keeping the crawl-delay that applies to our user agent."""
+        # The parsers match the crawl-delay to our User-agent group while parsing
+        parser: _RobotsRules
+        delay: float | str | None
+        if _has_protego:
+            rules = _ProtegoRules(robots_content)
+            delay = rules.crawl_delay(self.user_agent)
+            parser = rules
+        else:
+            stdlib_parser = RobotFileParser(f"https://{domain}/robots.txt")
+            stdlib_parser.parse(robots_content.splitlines())
+            # The stdlib parser only accepts whole-second delays; fractional ones fall back to the default
+            delay = stdlib_parser.crawl_delay(self.user_agent)
+            parser = stdlib_parser
+
+        if delay is not None:
+            self._crawl_delays[domain] = max(float(delay), 0.5)  # Minimum 0.5s
         return parser
 
-    def _parse_crawl_delay(self, domain: str, robots_content: str) -> None:
-        """Parse crawl-delay directive from robots.txt."""
-        for line in robots_content.splitlines():
-            if line.lower().strip().startswith("crawl-delay"):
-                try:
-                    delay = float(line.split(":", 1)[1].strip())
-                    self._crawl_delays[domain] = max(delay, 0.5)  # Minimum 0.5s
-                    break
-                except (ValueError, IndexError):
-                    continue
+    def _saved_robots_path(self, domain: str) -> Path:
+        """Path of domain's saved robots.txt; hashed, as domains may hold characters invalid in file names."""
+        return self._cache_dir / f"{hashlib.sha256(domain.encode()).hexdigest()[:32]}.txt"  # type: ignore[operator]
+
+    def _read_saved_robots(self, domain: str) -> tuple[str, float] | None:
+        """Read domain's saved robots.txt with its remaining lifetime, unless missing or older than ttl (blocking)."""
+        path = self._saved_robots_path(domain)
+        try:
+            remaining = self.ttl - (time.time() - path.stat().st_mtime)
+            if remaining <= 0:
+                return None
+            return path.read_text(encoding="utf-8"), remaining
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _save_robots(self, domain: str, robots_content: str) -> None:
+        """Save domain's robots.txt for later runs, replacing any older copy atomically (blocking)."""
+        path = self._saved_robots_path(domain)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_text(robots_content, encoding="utf-8")
+            temp_path.replace(path)
+        except OSError:
+            # Persisting is only an optimization; the in-memory cache still holds the rules
+            return
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=10, http2=True, headers={"User-Agent": self.user_agent})
+        return self._client
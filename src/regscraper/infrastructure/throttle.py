@@ -19,6 +19,10 @@ class ThrottledRobotsChecker:
         # Then acquire throttling lock
         await self._throttler.acquire(url)
 
+    def record_response(self, url: str, status_code: int | None) -> None:
+        """Report a response status (None for no response) so throttling can adapt."""
+        self._throttler.record_response(url, status_code)
+
     def release_throttle(self) -> None:
         """Release throttling resources."""
         self._throttler.release_global()
@@ -0,0 +1,14 @@
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit, urlunsplit
+
+
+@lru_cache(maxsize=8192)
+def get_domain(url: str) -> str:
+    """Extract the lower-cased domain from a URL (memoized, as every stage looks it up)."""
+    return urlparse(url).netloc.lower()
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form used to spot repeated URLs: lower-cased scheme and host, no fragment."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Protocol
+from typing import Any, Protocol, Self
 
 
 class ContentType(Enum):
@@ -15,6 +15,8 @@ class ContentType(Enum):
 class DownloadResult:
     """Result of a download operation."""
 
+    __slots__ = ("content", "content_type", "size", "url")
+
     def __init__(self, content: bytes, content_type: str | None = None, url: str = "") -> None:
         self.content = content
         self.content_type = content_type
@@ -25,6 +27,8 @@ class DownloadResult:
 class ExtractionResult:
     """Result of text extraction."""
 
+    __slots__ = ("length", "metadata", "text")
+
     def __init__(self, text: str, metadata: dict[str, Any] | None = None) -> None:
         self.text = text
         self.metadata = metadata or {}
@@ -34,6 +38,9 @@ class ExtractionResult:
 class Document:
     """Processed document with structured data."""
 
+    # No per-instance __dict__: a batch can hold many of these at once
+    __slots__ = ("document_type", "full_text", "issuing_authority", "publication_date", "source_url", "summary", "title")
+
     def __init__(
         self,
         source_url: str,
@@ -99,6 +106,15 @@ class Downloader(ABC):
     async def download(self, url: str) -> DownloadResult:
         """Download content from URL."""
 
+    async def aclose(self) -> None:  # noqa: B027
+        """Release pooled connections or processes; the downloader stays usable afterwards."""
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
 
 class TextExtractor(ABC):
     """Abstract base class for text extraction."""
@@ -0,0 +1,63 @@
+"""JSON serialization helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Try to import orjson - it's optional
+try:
+    import orjson
+
+    _has_orjson = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _has_orjson = False
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# Encoder settings are built once and reused for every call
+if _has_orjson:
+    _ORJSON_OPTIONS = {
+        True: orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+        False: orjson.OPT_NON_STR_KEYS,
+    }
+_STDLIB_ENCODERS = {
+    True: json.JSONEncoder(indent=2, ensure_ascii=False, default=str),
+    False: json.JSONEncoder(ensure_ascii=False, default=str),
+}
+
+
+def dumps(obj: object, *, indent: bool = True) -> str:
+    """Serialize an object to JSON text, stringifying values that are not JSON-native."""
+    if _has_orjson:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS[indent]).decode("utf-8")
+
+    return _STDLIB_ENCODERS[indent].encode(obj)
+
+
+def dumps_bytes(obj: object, *, indent: bool = True) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON, skipping the str step when orjson is available."""
+    if _has_orjson:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS[indent])
+
+    return _STDLIB_ENCODERS[indent].encode(obj).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:  # noqa: ANN401
+    """Parse JSON text or bytes."""
+    if _has_orjson:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def to_jsonable(obj: object) -> Any:  # noqa: ANN401
+    """Convert an object to JSON-native types, stringifying anything else."""
+    if isinstance(obj, _JSON_SCALARS):
+        return obj
+    if isinstance(obj, dict):
+        return {key if isinstance(key, str) else str(key): to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [to_jsonable(item) for item in obj]
+    return str(obj)
@@ -1,10 +1,14 @@
 """Async tests for regscraper components."""
 
+import asyncio
+from itertools import pairwise
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
+from regscraper.infrastructure.domain import DomainThrottler
 from regscraper.infrastructure.robots import RobotsTxtChecker
 
 
@@ -43,7 +47,7 @@ class TestRobotsTxtChecker:
 
             mock_context = AsyncMock()
             mock_context.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_context
+            mock_client.return_value = mock_context
 
             # Should allow public URLs
             result = await checker.is_allowed("https://example.com/public/page")
@@ -65,7 +69,7 @@ class TestRobotsTxtChecker:
 
             mock_context = AsyncMock()
             mock_context.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_context
+            mock_client.return_value = mock_context
 
             # Should allow access when robots.txt not found
             result = await checker.is_allowed("https://example.com/any-page")
@@ -84,6 +88,166 @@ class TestRobotsTxtChecker:
             result = await checker.is_allowed("https://example.com/page")
             assert result is True
 
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_fetch_robots_once(self):
+        """Test that concurrent checks for a new domain share one robots.txt fetch."""
+        checker = RobotsTxtChecker()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "User-agent: *\nDisallow: /private/"
+
+            mock_context = AsyncMock()
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            results = await asyncio.gather(*(checker.is_allowed(f"https://example.com/page{i}") for i in range(5)))
+
+            assert all(results)
+            assert mock_context.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_robots_refetched(self):
+        """Test that robots.txt is fetched again once the TTL has passed."""
+        checker = RobotsTxtChecker(ttl=0)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 404
+
+            mock_context = AsyncMock()
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            await checker.is_allowed("https://example.com/a")
+            await checker.is_allowed("https://example.com/b")
+
+            assert mock_context.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_robots_client_shared_across_domains(self):
+        """Test that robots.txt fetches for different domains reuse one HTTP client."""
+        checker = RobotsTxtChecker()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 404
+
+            mock_context = AsyncMock()
+            mock_context.is_closed = False
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            await checker.is_allowed("https://a.example.com/page")
+            await checker.is_allowed("https://b.example.com/page")
+            await checker.aclose()
+
+            assert mock_client.call_count == 1
+            assert mock_context.get.await_count == 2
+            mock_context.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_robots_cached_for_negative_ttl(self):
+        """Test that a missing robots.txt expires after the shorter negative TTL."""
+        checker = RobotsTxtChecker(negative_ttl=0)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 404
+
+            mock_context = AsyncMock()
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            await checker.is_allowed("https://example.com/a")
+            await checker.is_allowed("https://example.com/b")
+            assert mock_context.get.await_count == 2
+
+            mock_response.status_code = 200
+            mock_response.text = "User-agent: *\nAllow: /"
+            await checker.is_allowed("https://example.com/c")
+            await checker.is_allowed("https://example.com/d")
+            assert mock_context.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used_domain(self):
+        """Test that the robots.txt cache is capped at max_domains."""
+        checker = RobotsTxtChecker(max_domains=2)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "User-agent: *\nAllow: /"
+
+            mock_context = AsyncMock()
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            for domain in ("a.com", "b.com", "a.com", "c.com"):
+                await checker.is_allowed(f"https://{domain}/page")
+
+            assert list(checker._cache) == ["a.com", "c.com"]  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_robots_saved_to_disk_reused_by_new_checker(self, tmp_path: Path):
+        """Test that a robots.txt saved by one checker is read from disk by the next, without a fetch."""
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "User-agent: *\nDisallow: /private/\nCrawl-delay: 4"
+
+            mock_context = AsyncMock()
+            mock_context.is_closed = False
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            assert not await RobotsTxtChecker(cache_dir=tmp_path).is_allowed("https://example.com/private/a")
+
+            restarted = RobotsTxtChecker(cache_dir=tmp_path)
+            assert not await restarted.is_allowed("https://example.com/private/b")
+            assert await restarted.is_allowed("https://example.com/public")
+            assert restarted.get_crawl_delay("https://example.com/") == 4.0
+
+            assert mock_context.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_saved_robots_refetched(self, tmp_path: Path):
+        """Test that a saved robots.txt older than the TTL is fetched again."""
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "User-agent: *\nAllow: /"
+
+            mock_context = AsyncMock()
+            mock_context.is_closed = False
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            await RobotsTxtChecker(cache_dir=tmp_path, ttl=0).is_allowed("https://example.com/page")
+            await RobotsTxtChecker(cache_dir=tmp_path, ttl=0).is_allowed("https://example.com/page")
+
+            assert mock_context.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_crawl_delay_taken_from_matching_group(self):
+        """Test that only the crawl-delay of the User-agent group that applies to us is used."""
+        checker = RobotsTxtChecker()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "User-agent: OtherBot\nCrawl-delay: 30\n\nUser-agent: *\nCrawl-delay: 3\nAllow: /"
+
+            mock_context = AsyncMock()
+            mock_context.is_closed = False
+            mock_context.get.return_value = mock_response
+            mock_client.return_value = mock_context
+
+            await checker.is_allowed("https://example.com/page")
+
+        assert checker.get_crawl_delay("https://example.com/page") == 3.0
+
     def test_crawl_delay_defaults(self):
         """Test crawl delay default behavior."""
         checker = RobotsTxtChecker()
@@ -92,3 +256,82 @@ class TestRobotsTxtChecker:
         delay = checker.get_crawl_delay("https://unknown.example.com")
         assert isinstance(delay, float)
         assert delay > 0
+
+
+class TestDomainThrottler:
+    """Test DomainThrottler functionality."""
+
+    def test_backoff_on_overload(self):
+        """Test that overload responses double the delay up to the maximum."""
+        throttler = DomainThrottler(default_delay=2.0, max_delay=5.0)
+
+        throttler.record_response("https://example.com/a", 429)
+        assert throttler.get_delay("example.com") == 4.0
+
+        throttler.record_response("https://example.com/b", None)
+        assert throttler.get_delay("example.com") == 5.0
+
+    def test_recovery_stops_at_configured_delay(self):
+        """Test that successful responses shrink the delay back to the configured value."""
+        throttler = DomainThrottler(default_delay=2.0)
+        throttler.configure_domain("example.com", 1.0, 1)
+
+        throttler.record_response("https://example.com/a", 503)
+        assert throttler.get_delay("example.com") == 2.0
+
+        throttler.record_response("https://example.com/a", 200)
+        assert throttler.get_delay("example.com") == 1.8
+
+        for _ in range(20):
+            throttler.record_response("https://example.com/a", 200)
+        assert throttler.get_delay("example.com") == 1.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_spaced_by_delay(self):
+        """Test that concurrent requests to one domain still start a full delay apart."""
+        throttler = DomainThrottler()
+        throttler.configure_domain("example.com", 0.05, 3)
+        loop = asyncio.get_running_loop()
+        started: list[float] = []
+
+        async def request() -> None:
+            await throttler.acquire("https://example.com/page")
+            started.append(loop.time())
+            throttler.release_global()
+
+        await asyncio.gather(*(request() for _ in range(3)))
+
+        gaps = [later - earlier for earlier, later in pairwise(started)]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_domain_delay_does_not_hold_global_slot(self):
+        """Test that a request waiting out its domain delay leaves the global slot to other domains."""
+        throttler = DomainThrottler()
+        throttler._global_semaphore = asyncio.Semaphore(1)  # noqa: SLF001
+        throttler.configure_domain("slow.com", 5.0, 1)
+
+        await throttler.acquire("https://slow.com/first")
+        throttler.release_global()
+
+        waiting = asyncio.create_task(throttler.acquire("https://slow.com/second"))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(throttler.acquire("https://fast.com/page"), timeout=1.0)
+        throttler.release_global()
+
+        assert not waiting.done()
+        waiting.cancel()
+
+    def test_ensure_domain_keeps_existing_state(self):
+        """Test that ensure_domain creates state once and never overrides configuration."""
+        throttler = DomainThrottler(default_delay=2.0)
+        throttler.configure_domain("configured.com", 5.0, 1)
+
+        configured_lock = throttler.ensure_domain("configured.com", 1.0, 4)
+        new_lock = throttler.ensure_domain("new.com", 3.0, 2)
+
+        assert throttler.ensure_domain("new.com") is new_lock
+        assert throttler.ensure_domain("configured.com") is configured_lock
+        assert throttler.get_delay("configured.com") == 5.0
+        assert throttler.get_delay("new.com") == 3.0
@@ -1,12 +1,27 @@
 """Basic tests for key components of the scraper."""
 
+import asyncio
+import io
+import zipfile
+from pathlib import Path
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call
 
+import fitz  # type: ignore[import-untyped]
+import httpx
 import pytest
+from docx import Document as DocxDocument  # type: ignore[import-untyped]
+from PIL import Image
+from tenacity import wait_none
 
 from regscraper.downloader.factory import DownloaderFactory
+from regscraper.downloader.http import HttpDownloader
+from regscraper.extractor import pdf as pdf_module
+from regscraper.extractor.docx import DocxTextExtractor, _stream_docx_paragraphs
 from regscraper.extractor.factory import ExtractorFactory
+from regscraper.extractor.pdf import PdfTextExtractor
 from regscraper.interfaces import ContentType, Document, DownloadResult, ExtractionResult
+from regscraper.serialization import dumps, loads, to_jsonable
 
 
 class TestInterfaces:
@@ -96,8 +111,42 @@ class TestFactories:
 
         assert downloader1 is not None
         assert downloader2 is not None
-        # Different instances for different requests
-        assert downloader1 is not downloader2
+        # Domains of the same site type share one downloader (and its connection pool)
+        assert downloader1 is downloader2
+
+    def test_downloader_factory_separates_site_types(self):
+        """Dynamic sites get their own downloader."""
+        factory = DownloaderFactory({"dynamic.com": {"type": "dynamic"}})
+
+        static = factory.create_downloader("https://static.com")
+        dynamic = factory.create_downloader("https://dynamic.com")
+
+        assert static is not dynamic
+        assert factory.create_downloader("https://dynamic.com/other") is dynamic
+
+    def test_prepare_domains_keeps_throttler_defaults(self):
+        """Test that preparing domains applies overrides only where configured, not the wildcard."""
+        factory = DownloaderFactory(
+            {"known.com": {"delay": 5.0, "concurrency": 1}, "*": {"delay": 3.0, "concurrency": 1}}, default_delay=0.5, default_concurrency=4
+        )
+
+        factory.prepare_domains(["known.com", "new.com"])
+
+        throttler = factory._throttler  # noqa: SLF001
+        assert throttler.get_delay("known.com") == 5.0
+        assert throttler.get_delay("new.com") == 0.5
+        assert throttler.ensure_domain("new.com")._value == 4  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_downloader_context_manager_releases_client(self):
+        """Test that leaving an async with block closes the downloader's pooled client."""
+        factory = DownloaderFactory({})
+
+        async with factory.create_downloader("https://example.com") as downloader:
+            client = downloader._get_client()  # type: ignore[attr-defined]  # noqa: SLF001
+
+        assert client.is_closed
+        await factory.aclose()
 
     def test_extractor_factory_basic(self):
         """Test basic ExtractorFactory functionality."""
@@ -134,6 +183,17 @@ class TestFactories:
         assert pdf_extractor is not None
         assert html_extractor is not None
 
+    def test_content_type_detection_rules(self):
+        """Test that URL rules win over headers and header parameters are ignored."""
+        factory = ExtractorFactory()
+        docx_mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+        assert factory._detect_content_type("https://example.com/a.PDF", "text/html") == ContentType.PDF  # noqa: SLF001
+        assert factory._detect_content_type("https://example.com/news/rss", "") == ContentType.RSS  # noqa: SLF001
+        assert factory._detect_content_type("https://example.com/f", docx_mime) == ContentType.DOCX  # noqa: SLF001
+        assert factory._detect_content_type("https://example.com/f", "Application/PDF; q=1") == ContentType.PDF  # noqa: SLF001
+        assert factory._detect_content_type("https://example.com/f", "application/x-unknown") == ContentType.HTML  # noqa: SLF001
+
     def test_extractor_factory_default_fallback(self):
         """Test ExtractorFactory defaults to HTML for unknown types."""
         factory = ExtractorFactory()
@@ -145,5 +205,222 @@ class TestFactories:
         assert hasattr(extractor, "extract")
 
 
+class TestSerialization:
+    """Test JSON serialization helpers."""
+
+    def test_dumps_round_trip(self):
+        """Test that dumps output parses back to the same data."""
+        data: dict[str, Any] = {"url": "https://example.com", "text": "Règlement", "pages": 3}
+
+        assert loads(dumps(data)) == data
+        assert "Règlement" in dumps(data, indent=False)
+
+    def test_dumps_stringifies_unknown_types(self):
+        """Test that non JSON-native values are converted to strings."""
+        data: dict[str, Any] = {"path": Path("docs/file.pdf")}
+
+        assert loads(dumps(data)) == {"path": str(Path("docs/file.pdf"))}
+
+    def test_to_jsonable_normalizes_nested_values(self):
+        """Test that nested containers are converted to JSON-native types."""
+        data: dict[Any, Any] = {"pages": (1, 2), 3: {"path": Path("a.pdf"), "ok": True, "none": None}}
+
+        assert to_jsonable(data) == {"pages": [1, 2], "3": {"path": str(Path("a.pdf")), "ok": True, "none": None}}
+
+
+class TestDocxExtraction:
+    """Test DOCX text extraction."""
+
+    @pytest.mark.asyncio
+    async def test_docx_paragraphs_streamed(self):
+        """Test that paragraphs, tabs and table cells are read from document.xml."""
+        document = DocxDocument()
+        document.add_paragraph("First")
+        document.add_paragraph("   ")
+        paragraph = document.add_paragraph("a")
+        paragraph.add_run().add_tab()
+        paragraph.add_run("b")
+        document.add_table(rows=1, cols=1).cell(0, 0).text = "cell"
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        result = await DocxTextExtractor().extract(DownloadResult(buffer.getvalue(), url="https://example.com/rule.docx"))
+
+        assert result.text == "First\na\tb\ncell"
+        assert result.metadata == {"format": "docx", "paragraphs": 3}
+
+    def test_text_box_read_once_and_kept_apart(self):
+        """Test that text box content is read once, as its own paragraph, without splitting its host paragraph."""
+        text_box = "<w:txbxContent><w:p><w:r><w:t>BOXTEXT</w:t></w:r></w:p></w:txbxContent>"
+        document_xml = (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+            ' xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"><w:body>'
+            '<w:p><w:r><w:t xml:space="preserve">Lead </w:t></w:r><w:r><mc:AlternateContent>'
+            f'<mc:Choice Requires="wps">{text_box}</mc:Choice><mc:Fallback>{text_box}</mc:Fallback>'
+            "</mc:AlternateContent></w:r><w:r><w:t>tail</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>Before</w:t></w:r></w:p><w:p><w:r><w:t>After</w:t></w:r></w:p>"
+            "</w:body></w:document>"
+        )
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as package:
+            package.writestr("word/document.xml", document_xml)
+        buffer.seek(0)
+
+        assert _stream_docx_paragraphs(buffer) == ["BOXTEXT", "Lead tail", "Before", "After"]
+
+    def test_legacy_doc_signature_detected(self):
+        """Test that the OLE2 magic bytes identify a legacy DOC file."""
+        extractor = DocxTextExtractor()
+
+        assert extractor._is_legacy_doc_format(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 64)  # noqa: SLF001
+        assert not extractor._is_legacy_doc_format(b"PK\x03\x04")  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_invalid_docx_raises(self):
+        """Test that unreadable content surfaces as a RuntimeError."""
+        with pytest.raises(RuntimeError):
+            await DocxTextExtractor().extract(DownloadResult(b"not a zip", url="https://example.com/rule.docx"))
+
+
+class TestPdfExtraction:
+    """Test PDF text extraction."""
+
+    @pytest.mark.asyncio
+    async def test_ocr_pages_kept_in_order(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that scanned pages are OCRed in page order and blank pages are skipped."""
+        monkeypatch.setattr(pdf_module, "_ocr_image", lambda image: f"scanned {image.mode}")
+        scan = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 20, 20), False)
+        document = fitz.open()
+        document.new_page().insert_text((72, 72), "first")
+        for _ in range(6):
+            document.new_page().insert_image(fitz.Rect(0, 0, 300, 400), pixmap=scan)
+        document.new_page()  # Blank page: nothing to OCR
+        document.new_page().insert_text((72, 72), "last")
+
+        result = await PdfTextExtractor(ocr_dpi=10).extract(DownloadResult(document.tobytes(), url="https://example.com/a.pdf"))
+
+        assert [line for line in result.text.splitlines() if line] == ["first", *["scanned L"] * 6, "last"]
+        assert result.metadata == {"pages_processed": 9, "ocr_pages": 6}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_extractions(self):
+        """Test that concurrent extractions, which take turns in PyMuPDF, each return their own text."""
+        documents = []
+        for i in range(4):
+            document = fitz.open()
+            document.new_page().insert_text((72, 72), f"document {i}")
+            documents.append(DownloadResult(document.tobytes(), url=f"https://example.com/{i}.pdf"))
+
+        results = await asyncio.gather(*(PdfTextExtractor().extract(document) for document in documents))
+
+        assert [result.text for result in results] == [f"document {i}" for i in range(4)]
+
+    def test_tesserocr_load_failure_falls_back_to_pytesseract(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a tesserocr load failure is recorded once and later pages use pytesseract."""
+        attempts: list[int] = []
+
+        def failing_api(**_kwargs: Any) -> None:
+            attempts.append(1)
+            msg = "Failed to init API, possibly an invalid tessdata path"
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(pdf_module, "_has_tesserocr", True)
+        monkeypatch.setattr(pdf_module, "PSM", MagicMock())
+        monkeypatch.setattr(pdf_module, "PyTessBaseAPI", failing_api)
+        monkeypatch.setattr(pdf_module, "_tesserocr_failed", pdf_module.threading.Event())
+        monkeypatch.setattr(pdf_module.pytesseract, "image_to_string", lambda _image: "fallback text")
+
+        texts = [pdf_module._ocr_image(Image.new("L", (10, 10))) for _ in range(3)]  # noqa: SLF001
+
+        assert texts == ["fallback text"] * 3
+        assert len(attempts) == 1
+
+    def test_single_ocr_thread_in_worker_process(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a worker process OCRs on one thread, since the process pool already uses every core."""
+        monkeypatch.setattr(pdf_module.multiprocessing, "parent_process", object)
+        pdf_module._ocr_executor.cache_clear()  # noqa: SLF001
+        try:
+            executor = pdf_module._ocr_executor()  # noqa: SLF001
+            assert executor._max_workers == 1  # noqa: SLF001
+            executor.shutdown()
+        finally:
+            pdf_module._ocr_executor.cache_clear()  # noqa: SLF001
+
+
+class TestHttpDownloader:
+    """Test HTTP download retries."""
+
+    @staticmethod
+    def _downloader(responses: list[httpx.Response]) -> tuple[HttpDownloader, list[httpx.Request]]:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return responses[len(requests) - 1]
+
+        checker = MagicMock(check_and_acquire=AsyncMock())
+        downloader = HttpDownloader(checker)
+        downloader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # noqa: SLF001
+        return downloader, requests
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_download_retried_after_retry_after(self):
+        """Test that a 429 is retried, waiting only as long as Retry-After asks."""
+        downloader, requests = self._downloader(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, content=b"ok", headers={"Content-Type": "text/plain"}),
+            ]
+        )
+
+        result = await downloader.download("https://example.com/page")
+
+        assert result.content == b"ok"
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_http_date_without_zone_offset(self):
+        """Test that a Retry-After HTTP date in the "-0000" zone is honored instead of failing the download."""
+        downloader, requests = self._downloader(
+            [
+                httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 -0000"}),
+                httpx.Response(200, content=b"ok"),
+            ]
+        )
+
+        result = await downloader.download("https://example.com/page")
+
+        assert result.content == b"ok"
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self):
+        """Test that a 404 fails on the first attempt."""
+        downloader, requests = self._downloader([httpx.Response(404)])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await downloader.download("https://example.com/missing")
+
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_error_recorded_as_no_response(self):
+        """Test that a refused connection is reported to the throttler like a timeout."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            msg = "connection refused"
+            raise httpx.ConnectError(msg, request=request)
+
+        checker = MagicMock(check_and_acquire=AsyncMock())
+        downloader = HttpDownloader(checker)
+        downloader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # noqa: SLF001
+        download = HttpDownloader.download.retry_with(wait=wait_none())  # type: ignore[attr-defined]
+
+        with pytest.raises(httpx.ConnectError):
+            await download(downloader, "https://example.com/page")
+
+        assert checker.record_response.call_args_list == [call("https://example.com/page", None)] * 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,16 +1,53 @@
 """Test the batch scraping functionality."""
 
+import asyncio
+import json
 import logging
 import time
+from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
+import fitz  # type: ignore[import-untyped]
+import httpx
 import pytest
 
-from regscraper.batch import BatchScraper, scrape_urls_batch
+from regscraper.batch import BatchScraper, _ResultWriter, scrape_urls_batch
+from regscraper.extractor.pdf import PdfTextExtractor
+from regscraper.interfaces import Downloader, DownloadResult
 
 logger = logging.getLogger(__name__)
 
 
+class FakeHtmlDownloader(Downloader):
+    """Downloader returning a fixed HTML page without network access."""
+
+    async def download(self, url: str) -> DownloadResult:
+        paragraphs = "".join(f"<p>Paragraph {i} of the regulatory notice with enough words to keep.</p>" for i in range(20))
+        html = f"<html><body><article><h1>Notice</h1>{paragraphs}</article></body></html>"
+        return DownloadResult(html.encode("utf-8"), "text/html", url)
+
+
+class FakeScannedPdfDownloader(Downloader):
+    """Downloader returning an image-only PDF, so extraction goes through OCR."""
+
+    async def download(self, url: str) -> DownloadResult:
+        scan = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 20, 20), False)
+        document = fitz.open()
+        document.new_page().insert_image(fitz.Rect(0, 0, 300, 400), pixmap=scan)
+        return DownloadResult(document.tobytes(), "application/pdf", url)
+
+
+class FakeNotFoundDownloader(Downloader):
+    """Downloader whose server always answers 404."""
+
+    async def download(self, url: str) -> DownloadResult:
+        request = httpx.Request("GET", url)
+        response = httpx.Response(404, request=request)
+        response.raise_for_status()
+        return DownloadResult(response.content, "", url)
+
+
 class TestBatchScraper:
     """Test batch scraping with shared throttling."""
 
@@ -128,3 +165,200 @@ class TestBatchScraper:
         # Test that scraper accepts configuration parameters
         configured_scraper = BatchScraper(default_delay=5.0, default_concurrency=3, user_agent="Test Agent")
         assert configured_scraper is not None
+
+    def test_downloader_reused_per_domain(self) -> None:
+        """Test that URLs of every domain share the downloader of their site type."""
+        scraper = BatchScraper()
+
+        factory = scraper._downloader_factory  # noqa: SLF001
+        first = factory.create_downloader("https://www.sec.gov/doc1")
+        second = factory.create_downloader("https://WWW.SEC.GOV/doc2")
+        other = factory.create_downloader("https://www.bis.org/doc1")
+
+        assert first is second
+        # Static sites share the factory's downloader and its connection pool
+        assert first is other
+
+    @pytest.mark.asyncio
+    async def test_results_streamed_to_disk(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that results are written to disk and only summaries are kept in memory."""
+
+        async def fake_scrape(url: str, global_semaphore: asyncio.Semaphore, idx: int, _pool: object) -> dict[str, Any]:
+            async with global_semaphore:
+                return {"url": url, "success": idx != 1, "error": "", "text": f"text {idx}", "metadata": {}}
+
+        scraper = BatchScraper()
+        monkeypatch.setattr(scraper, "_scrape_single_url", fake_scrape)
+        urls = ["https://www.sec.gov/doc1", "https://www.sec.gov/doc2", "https://www.bis.org/doc1"]
+
+        results = await scraper.scrape_urls(urls=urls, output_dir=tmp_path)
+
+        assert [r["url"] for r in results] == urls
+        assert all(r["text"] == "" for r in results)
+        assert scraper.last_summary["success"] == 2
+        assert scraper.last_summary["errors"] == 1
+        saved = json.loads((tmp_path / "batch_results.json").read_text(encoding="utf-8"))
+        assert sorted(r["text"] for r in saved) == ["text 0", "text 1", "text 2"]
+
+        jsonl_dir = tmp_path / "jsonl"
+        await scraper.scrape_urls(urls=urls, output_format="jsonl", output_dir=jsonl_dir)
+
+        lines = (jsonl_dir / "batch_results.jsonl").read_text(encoding="utf-8").splitlines()
+        assert sorted(json.loads(line)["url"] for line in lines) == sorted(urls)
+
+        combined_dir = tmp_path / "combined"
+        await scraper.scrape_urls(urls=urls, output_format="text", output_dir=combined_dir)
+
+        combined = (combined_dir / "batch_results.txt").read_text(encoding="utf-8")
+        assert combined.count("=" * 80) == 2
+        assert "text 1" not in combined
+
+        text_dir = tmp_path / "text"
+        await scraper.scrape_urls(urls=urls, output_format="text", output_dir=text_dir, save_individually=True)
+
+        assert (text_dir / "result_0000_www_sec_gov.txt").read_text(encoding="utf-8") == "text 0"
+        assert len(list(text_dir.iterdir())) == len(urls)
+
+    @pytest.mark.asyncio
+    async def test_failed_write_recorded_as_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a result that cannot be written fails only its own URL, not the whole batch."""
+
+        async def fake_scrape(url: str, global_semaphore: asyncio.Semaphore, idx: int, _pool: object) -> dict[str, Any]:
+            async with global_semaphore:
+                return {"url": url, "success": True, "error": "", "text": f"text {idx}", "metadata": {}}
+
+        write_individual = _ResultWriter._write_individual  # noqa: SLF001
+
+        async def failing_write(writer: _ResultWriter, idx: int, result: dict[str, Any]) -> Path:
+            if idx == 1:
+                msg = "disk full"
+                raise OSError(msg)
+            return await write_individual(writer, idx, result)
+
+        scraper = BatchScraper()
+        monkeypatch.setattr(scraper, "_scrape_single_url", fake_scrape)
+        monkeypatch.setattr(_ResultWriter, "_write_individual", failing_write)
+        urls = ["https://a.com/0", "https://a.com/1", "https://b.com/2"]
+
+        results = await scraper.scrape_urls(urls=urls, output_dir=tmp_path, save_individually=True)
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["error"] == "disk full"
+        assert scraper.last_summary["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_per_domain_worker_concurrency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that each domain is processed by at most its configured number of workers."""
+        in_flight: dict[str, int] = {"a.com": 0, "b.com": 0}
+        peak: dict[str, int] = {"a.com": 0, "b.com": 0}
+
+        async def fake_scrape(url: str, global_semaphore: asyncio.Semaphore, idx: int, _pool: object) -> dict[str, Any]:
+            domain = urlparse(url).netloc
+            async with global_semaphore:
+                in_flight[domain] += 1
+                peak[domain] = max(peak[domain], in_flight[domain])
+                await asyncio.sleep(0.01)
+                in_flight[domain] -= 1
+            return {"url": url, "success": True, "error": "", "text": str(idx), "metadata": {}}
+
+        scraper = BatchScraper(
+            site_overrides={
+                "a.com": {"delay": 0.0, "concurrency": 2, "type": "static"},
+                "b.com": {"delay": 0.0, "concurrency": 1, "type": "static"},
+            }
+        )
+        monkeypatch.setattr(scraper, "_scrape_single_url", fake_scrape)
+        urls = [f"https://a.com/{i}" for i in range(5)] + [f"https://b.com/{i}" for i in range(3)]
+
+        results = await scraper.scrape_urls(urls=urls, max_concurrent=10)
+
+        assert [r["url"] for r in results] == urls
+        assert peak == {"a.com": 2, "b.com": 1}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_scraped_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that repeated URLs are fetched once and share the first result."""
+        scraped: list[str] = []
+
+        async def fake_scrape(url: str, global_semaphore: asyncio.Semaphore, idx: int, _pool: object) -> dict[str, Any]:
+            async with global_semaphore:
+                scraped.append(url)
+            return {"url": url, "success": True, "error": "", "text": str(idx), "metadata": {}}
+
+        scraper = BatchScraper()
+        monkeypatch.setattr(scraper, "_scrape_single_url", fake_scrape)
+        urls = ["https://a.com/doc", "https://A.COM/doc#section", "https://a.com/other", "https://a.com/doc"]
+
+        results = await scraper.scrape_urls(urls=urls)
+
+        assert scraped == ["https://a.com/doc", "https://a.com/other"]
+        assert [r["text"] for r in results] == ["0", "0", "2", "0"]
+        assert [r["url"] for r in results] == urls
+        assert results[1] is not results[0]
+        assert scraper.last_summary["success"] == 4
+
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_written_to_disk(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that each repeat of a URL gets its own saved record, individually and in combined output."""
+
+        async def fake_scrape(url: str, global_semaphore: asyncio.Semaphore, idx: int, _pool: object) -> dict[str, Any]:
+            async with global_semaphore:
+                return {"url": url, "success": True, "error": "", "text": f"text {idx}", "metadata": {}}
+
+        scraper = BatchScraper()
+        monkeypatch.setattr(scraper, "_scrape_single_url", fake_scrape)
+        urls = ["https://a.com/doc", "https://b.com/other", "https://A.COM/doc#section"]
+
+        individual_dir = tmp_path / "individual"
+        results = await scraper.scrape_urls(urls=urls, output_dir=individual_dir, save_individually=True)
+
+        assert results[2]["path"] == str(individual_dir / "result_0002_a_com.json")
+        assert json.loads((individual_dir / "result_0002_a_com.json").read_text(encoding="utf-8"))["text"] == "text 0"
+        assert len(list(individual_dir.iterdir())) == len(urls)
+
+        jsonl_dir = tmp_path / "jsonl"
+        await scraper.scrape_urls(urls=urls, output_format="jsonl", output_dir=jsonl_dir)
+
+        lines = (jsonl_dir / "batch_results.jsonl").read_text(encoding="utf-8").splitlines()
+        saved = {record["url"]: record["text"] for record in map(json.loads, lines)}
+        assert saved == {urls[0]: "text 0", urls[1]: "text 1", urls[2]: "text 0"}
+
+    @pytest.mark.asyncio
+    async def test_extraction_runs_in_worker_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that downloaded content is extracted in the worker pool."""
+        scraper = BatchScraper(extraction_workers=1)
+        monkeypatch.setattr(scraper._downloader_factory, "create_downloader", lambda _url: FakeHtmlDownloader())  # noqa: SLF001
+
+        results = await scraper.scrape_urls(urls=["https://example.com/notice"])
+
+        assert results[0]["success"] is True
+        assert "Paragraph 0" in results[0]["text"]
+        assert results[0]["text_length"] == len(results[0]["text"])
+        assert results[0]["metadata"]["extraction_method"] in {"trafilatura", "basic"}
+
+    @pytest.mark.asyncio
+    async def test_http_error_recorded_without_traceback(self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that an HTTP error status is an ordinary failed record, not an unexpected exception."""
+        scraper = BatchScraper(extraction_workers=1)
+        monkeypatch.setattr(scraper._downloader_factory, "create_downloader", lambda _url: FakeNotFoundDownloader())  # noqa: SLF001
+
+        with caplog.at_level(logging.WARNING, logger="regscraper.batch"):
+            results = await scraper.scrape_urls(urls=["https://example.com/missing"])
+
+        assert results[0]["success"] is False
+        assert "404" in results[0]["error"]
+        assert results[0]["content_length"] == 0
+        assert all(record.exc_info is None for record in caplog.records)
+
+    @pytest.mark.asyncio
+    async def test_worker_ocr_unaffected_by_parent_ocr_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that workers OCR scanned PDFs even when the parent process has already run OCR."""
+        scanned = await FakeScannedPdfDownloader().download("https://example.com/local.pdf")
+        await PdfTextExtractor().extract(scanned)
+        scraper = BatchScraper(extraction_workers=1)
+        monkeypatch.setattr(scraper._downloader_factory, "create_downloader", lambda _url: FakeScannedPdfDownloader())  # noqa: SLF001
+
+        results = await asyncio.wait_for(scraper.scrape_urls(urls=["https://example.com/scan.pdf"]), timeout=60)
+
+        assert results[0]["success"] is True
+        assert results[0]["metadata"]["pages_processed"] == 1